@@ -7,7 +7,7 @@ Modern, unified network management script for Paradigm cryptocurrency.
 Replaces outdated batch files with cross-platform Python solution.
 
 Usage:
-    python paradigm-network.py build [--advanced]
+    python paradigm-network.py build [--advanced] [--clean]
     python paradigm-network.py start [--genesis] [--port PORT] [--peers PEERS]
     python paradigm-network.py test [--nodes N] [--stress]
     python paradigm-network.py wallet [COMMAND] [ARGS...]
@@ -27,10 +27,16 @@ Built with ❤️ by the Paradigm Core Team
 """
 
 import argparse
+import contextlib
+import functools
+import http.client
 import json
 import os
 import platform
+import selectors
 import shutil
+import signal
+import socket
 import subprocess
 import sys
 import time
@@ -42,6 +48,14 @@ PARADIGM_VERSION = "2024.1"
 DEFAULT_PORT = 8080
 DEFAULT_API_PORT = 8080
 
+# Platform and layout are fixed for the lifetime of the process
+SYSTEM = platform.system().lower()
+EXE_SUFFIX = ".exe" if SYSTEM == "windows" else ""
+ROOT_PATH = Path(__file__).resolve().parent
+TARGET_PATH = ROOT_PATH / "target"
+RELEASE_PATH = TARGET_PATH / "release"
+DEBUG_PATH = TARGET_PATH / "debug"
+
 class Colors:
     """Cross-platform terminal colors."""
     RED = '\033[91m'
@@ -56,49 +70,162 @@ class Colors:
 
     @classmethod
     def disable(cls):
-        """Disable colors for Windows compatibility."""
+        """Disable colors for terminals without ANSI support."""
         cls.RED = cls.GREEN = cls.YELLOW = cls.BLUE = ''
         cls.PURPLE = cls.CYAN = cls.WHITE = cls.BOLD = cls.END = ''
 
-# Disable colors on Windows unless in modern terminal
-if platform.system() == "Windows":
-    try:
-        # Enable ANSI colors on Windows 10+
-        os.system('color')
-    except:
-        Colors.disable()
+def _supports_color() -> bool:
+    """Check whether stdout is a terminal that understands ANSI colors."""
+    if not sys.stdout.isatty() or os.environ.get('TERM') == 'dumb':
+        return False
+    if SYSTEM == "windows":
+        try:
+            # Enable ANSI colors on Windows 10+
+            os.system('color')
+        except:
+            return False
+    return True
+
+USE_COLOR = _supports_color()
+
+# Disable colors when piped or on terminals without ANSI support
+if not USE_COLOR:
+    Colors.disable()
+
+# Message decorations are fixed once color support is known
+_HEADER_PREFIX = f"\n{Colors.CYAN}{Colors.BOLD}🚀 "
+_RULE_PREFIX = Colors.CYAN
+_SUCCESS_PREFIX = f"{Colors.GREEN}✅ "
+_ERROR_PREFIX = f"{Colors.RED}❌ "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠️  "
+_INFO_PREFIX = f"{Colors.BLUE}💡 "
+_SUFFIX = f"{Colors.END}\n"
 
 def print_header(title: str):
     """Print a formatted header."""
-    print(f"\n{Colors.CYAN}{Colors.BOLD}🚀 {title}{Colors.END}")
-    print(f"{Colors.CYAN}{'=' * (len(title) + 3)}{Colors.END}")
+    sys.stdout.write(_HEADER_PREFIX + title + _SUFFIX + _RULE_PREFIX + '=' * (len(title) + 3) + _SUFFIX)
 
 def print_success(msg: str):
     """Print success message."""
-    print(f"{Colors.GREEN}✅ {msg}{Colors.END}")
+    sys.stdout.write(_SUCCESS_PREFIX + msg + _SUFFIX)
 
 def print_error(msg: str):
     """Print error message."""
-    print(f"{Colors.RED}❌ {msg}{Colors.END}")
+    sys.stderr.write(_ERROR_PREFIX + msg + _SUFFIX)
 
 def print_warning(msg: str):
     """Print warning message."""
-    print(f"{Colors.YELLOW}⚠️  {msg}{Colors.END}")
+    sys.stdout.write(_WARNING_PREFIX + msg + _SUFFIX)
 
 def print_info(msg: str):
     """Print info message."""
-    print(f"{Colors.BLUE}💡 {msg}{Colors.END}")
+    sys.stdout.write(_INFO_PREFIX + msg + _SUFFIX)
+
+def wait_for_port(port: int, timeout: float = 10.0, host: str = "127.0.0.1") -> bool:
+    """Wait until a TCP port accepts connections, backing off exponentially."""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=0.1).close()
+            return True
+        except OSError:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+    return False
+
+def _tool_fingerprint(tool: str) -> Optional[Tuple[str, int]]:
+    """Identify an installed tool by path and mtime so upgrades invalidate caches."""
+    path = shutil.which(tool)
+    if path is None:
+        return None
+    try:
+        return path, os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=None)
+def _probe_tool(tool: str, fingerprint: Optional[Tuple[str, int]]) -> Optional[str]:
+    """Run `tool --version` once per fingerprint, returning its output or None."""
+    if fingerprint is None:
+        return None
+    try:
+        # Raw bytes: version banners are ASCII, no need for the text-mode decoder
+        result = subprocess.run([fingerprint[0], '--version'],
+                                capture_output=True, check=True)
+        return result.stdout.decode('ascii', 'replace')
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+def stop_processes(processes: List[subprocess.Popen], timeout: float = 5.0):
+    """Terminate all processes together, then reap them, killing any that hang."""
+    for process in processes:
+        if process.poll() is None:
+            try:
+                process.terminate()
+            except OSError:
+                pass
+    
+    deadline = time.monotonic() + timeout
+    for process in processes:
+        try:
+            process.wait(max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+@contextlib.contextmanager
+def interrupt_on_termination():
+    """Raise KeyboardInterrupt on SIGTERM/SIGHUP so Ctrl+C cleanup also runs for them."""
+    def handler(signum, frame):
+        raise KeyboardInterrupt
+    
+    previous = {}
+    for name in ('SIGTERM', 'SIGHUP'):  # No SIGHUP on Windows
+        signum = getattr(signal, name, None)
+        if signum is not None:
+            previous[signum] = signal.signal(signum, handler)
+    try:
+        yield
+    finally:
+        for signum, old_handler in previous.items():
+            signal.signal(signum, old_handler)
+
+def wait_for_any_exit(processes: List[subprocess.Popen]) -> List[subprocess.Popen]:
+    """Block until at least one process exits and return the ones that have."""
+    if hasattr(os, 'pidfd_open'):
+        # Linux 5.3+: the kernel wakes us on exit, no polling needed
+        pidfds = []
+        try:
+            with selectors.DefaultSelector() as selector:
+                for process in processes:
+                    pidfd = os.pidfd_open(process.pid)
+                    pidfds.append(pidfd)
+                    selector.register(pidfd, selectors.EVENT_READ, process)
+                ready = selector.select()
+            return [key.data for key, _ in ready if key.data.poll() is not None]
+        except OSError:
+            pass  # No pidfd support or process already reaped - fall back to polling
+        finally:
+            for pidfd in pidfds:
+                os.close(pidfd)
+    
+    while True:
+        exited = [process for process in processes if process.poll() is not None]
+        if exited:
+            return exited
+        time.sleep(1)
 
 class ParadigmLauncher:
     """Main launcher class for Paradigm network operations."""
     
     def __init__(self):
-        self.system = platform.system().lower()
-        self.exe_suffix = ".exe" if self.system == "windows" else ""
-        self.root_path = Path(__file__).parent.absolute()
-        self.target_path = self.root_path / "target"
-        self.release_path = self.target_path / "release"
-        self.debug_path = self.target_path / "debug"
+        self.system = SYSTEM
+        self.exe_suffix = EXE_SUFFIX
+        self.root_path = ROOT_PATH
+        self.target_path = TARGET_PATH
+        self.release_path = RELEASE_PATH
+        self.debug_path = DEBUG_PATH
         
         # Binary paths
         self.binaries = {
@@ -106,31 +233,38 @@ class ParadigmLauncher:
             'wallet': 'paradigm-wallet', 
             'contributor': 'paradigm-contributor'
         }
+        self._binary_exists: Dict[str, bool] = {}
         
+    def binary_path(self, name: str) -> Path:
+        """Path of a release binary by its short name ('core', 'wallet', ...)."""
+        return self.release_path / f"{self.binaries[name]}{self.exe_suffix}"
+    
+    def binary_exists(self, name: str) -> bool:
+        """Check a release binary exists, remembering the answer for this run."""
+        exists = self._binary_exists.get(name)
+        if exists is None:
+            exists = self._binary_exists[name] = self.binary_path(name).exists()
+        return exists
+    
     def check_rust(self) -> bool:
         """Check if Rust is installed."""
-        try:
-            result = subprocess.run(['cargo', '--version'], 
-                                  capture_output=True, text=True, check=True)
-            version = result.stdout.split()[1]
-            print_success(f"Rust {version} found")
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        output = _probe_tool('cargo', _tool_fingerprint('cargo'))
+        if output is None:
             print_error("Rust not found. Install from: https://rustup.rs/")
             return False
+        version = output.split()[1]
+        print_success(f"Rust {version} found")
+        return True
     
     def check_protoc(self) -> bool:
         """Check if protoc is installed (optional)."""
-        try:
-            subprocess.run(['protoc', '--version'], 
-                          capture_output=True, check=True)
-            print_success("protoc found (gRPC enabled)")
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if _probe_tool('protoc', _tool_fingerprint('protoc')) is None:
             print_warning("protoc not found - some features limited")
             return False
+        print_success("protoc found (gRPC enabled)")
+        return True
     
-    def build_system(self, advanced: bool = False) -> bool:
+    def build_system(self, advanced: bool = False, clean: bool = False) -> bool:
         """Build the Paradigm system."""
         print_header("Paradigm Build System")
         
@@ -139,14 +273,15 @@ class ParadigmLauncher:
             
         self.check_protoc()
         
-        # Clean previous build
-        print_info("Cleaning previous build...")
-        try:
-            if self.target_path.exists():
-                shutil.rmtree(self.target_path)
-            print_success("Clean completed")
-        except Exception as e:
-            print_warning(f"Clean partially failed: {e}")
+        # Clean previous build (only on request - keeps cargo's incremental cache warm)
+        if clean:
+            print_info("Cleaning previous build...")
+            try:
+                if self.target_path.exists():
+                    shutil.rmtree(self.target_path)
+                print_success("Clean completed")
+            except Exception as e:
+                print_warning(f"Clean partially failed: {e}")
         
         # Build configuration
         build_args = ['cargo', 'build', '--release']
@@ -164,18 +299,21 @@ class ParadigmLauncher:
             ('paradigm-contributor', '⚡ ML Task Processor')
         ]
         
+        # Single cargo invocation so the jobserver can schedule all crates in parallel
         for package, description in components:
-            print(f"\n{Colors.CYAN}Building {description}...{Colors.END}")
-            
-            try:
-                subprocess.run(build_args + ['--package', package], 
-                             check=True, cwd=self.root_path)
-                print_success(f"{description} built successfully")
-            except subprocess.CalledProcessError:
-                print_error(f"{description} build failed")
-                return False
+            build_args.extend(['-p', package])
+
+        print(f"\n{Colors.CYAN}Building {', '.join(d for _, d in components)}...{Colors.END}")
+
+        try:
+            subprocess.run(build_args, check=True, cwd=self.root_path)
+            print_success("All components built successfully")
+        except subprocess.CalledProcessError:
+            print_error("Build failed")
+            return False
         
-        # Verify binaries exist
+        # Verify binaries exist (the build may have changed them)
+        self._binary_exists.clear()
         self._verify_binaries()
         
         print_success("\n🎉 Build completed successfully!")
@@ -188,9 +326,8 @@ class ParadigmLauncher:
         print_info("\nVerifying binaries...")
         
         for name, binary in self.binaries.items():
-            binary_path = self.release_path / f"{binary}{self.exe_suffix}"
-            if binary_path.exists():
-                print_success(f"{binary} found at {binary_path}")
+            if self.binary_exists(name):
+                print_success(f"{binary} found at {self.binary_path(name)}")
             else:
                 print_error(f"{binary} not found")
     
@@ -211,8 +348,8 @@ class ParadigmLauncher:
         print_header("Paradigm Network Launcher")
         
         # Check binaries exist
-        core_binary = self.release_path / f"paradigm-core{self.exe_suffix}"
-        if not core_binary.exists():
+        core_binary = self.binary_path('core')
+        if not self.binary_exists('core'):
             print_error("paradigm-core binary not found. Run 'build' first.")
             return False
         
@@ -287,7 +424,7 @@ class ParadigmLauncher:
         """Create a default genesis configuration."""
         config = {
             "network": {
-                "chain_id": 1,
+                "chain_id": "1",
                 "network_name": "paradigm-mainnet",
                 "genesis_timestamp": "2024-01-01T00:00:00Z"
             },
@@ -311,27 +448,24 @@ class ParadigmLauncher:
             }
         }
         
-        with open(config_path, 'w') as f:
-            # Convert to TOML format (simplified)
-            f.write("[network]\\n")
-            for key, value in config["network"].items():
-                f.write(f'{key} = "{value}"\\n')
-                
-            f.write("\\n[consensus]\\n")
-            for key, value in config["consensus"].items():
-                f.write(f'{key} = {value}\\n')
-                
-            f.write("\\n[ai_governance]\\n")
-            for key, value in config["ai_governance"].items():
-                f.write(f'{key} = {value}\\n')
-                
-            f.write("\\n[treasury]\\n")
-            for key, value in config["treasury"].items():
-                f.write(f'{key} = {value}\\n')
-                
-            f.write("\\n[security]\\n")
-            for key, value in config["security"].items():
-                f.write(f'{key} = {str(value).lower()}\\n')
+        # Convert to TOML format (simplified) - JSON scalars are valid TOML values
+        lines = []
+        for section, values in config.items():
+            if lines:
+                lines.append("")
+            lines.append(f"[{section}]")
+            for key, value in values.items():
+                lines.append(f"{key} = {json.dumps(value)}")
+        
+        # Write to a sibling temp file and swap it in so a crash never leaves
+        # a truncated genesis config behind
+        payload = ("\n".join(lines) + "\n").encode('utf-8')
+        tmp_path = config_path.with_name(config_path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
                 
         print_success(f"Created genesis configuration: {config_path}")
     
@@ -348,83 +482,98 @@ class ParadigmLauncher:
         """Run multi-node network test."""
         print_info(f"Starting {nodes}-node network test...")
         
-        processes = []
+        processes: List[subprocess.Popen] = []
         base_port = 8080
         
-        try:
-            # Start genesis node
-            print_info("Starting genesis node...")
-            genesis_cmd = [
-                str(self.release_path / f"paradigm-core{self.exe_suffix}"),
-                '--data-dir', './test-data/genesis',
-                '--genesis', 'genesis-config.toml',
-                '--port', str(base_port),
-                '--enable-api',
-                '--api-port', str(base_port)
-            ]
+        with contextlib.ExitStack() as cleanup:
+            # Nodes run in their own session, so terminal hangups and kills of the
+            # launcher must come through here; handlers stay installed until they are stopped
+            cleanup.enter_context(interrupt_on_termination())
+            # Nodes are always reaped, even if spawning fails partway through
+            cleanup.callback(stop_processes, processes)
             
-            processes.append(subprocess.Popen(genesis_cmd, cwd=self.root_path))
-            time.sleep(3)  # Let genesis node start
-            
-            # Start peer nodes
-            for i in range(1, nodes):
-                port = base_port + i
-                print_info(f"Starting peer node {i} on port {port}...")
-                
-                peer_cmd = [
-                    str(self.release_path / f"paradigm-core{self.exe_suffix}"),
-                    '--data-dir', f'./test-data/node-{i}',
-                    '--port', str(port),
-                    '--addnode', f'127.0.0.1:{base_port}',
+            try:
+                # Start genesis node
+                print_info("Starting genesis node...")
+                genesis_cmd = [
+                    str(self.binary_path('core')),
+                    '--data-dir', './test-data/genesis',
+                    '--genesis', 'genesis-config.toml',
+                    '--port', str(base_port),
                     '--enable-api',
-                    '--api-port', str(port + 1000)
+                    '--api-port', str(base_port)
                 ]
                 
-                processes.append(subprocess.Popen(peer_cmd, cwd=self.root_path))
-                time.sleep(2)  # Stagger startup
-            
-            print_success(f"✅ {nodes}-node test network started!")
-            print_info("🔗 Genesis API: http://localhost:8080")
-            for i in range(1, nodes):
-                print_info(f"🔗 Node {i} API: http://localhost:{8080 + i + 1000}")
+                processes.append(self._spawn_node(genesis_cmd))
+                if not wait_for_port(base_port):  # Let genesis node start
+                    print_warning(f"Genesis node not accepting connections on port {base_port} yet")
                 
-            print(f"\\n{Colors.YELLOW}Press Ctrl+C to stop test network{Colors.END}")
-            
-            # Wait for interrupt
-            try:
-                while True:
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                print(f"\\n{Colors.YELLOW}Stopping test network...{Colors.END}")
-                
-                # Stop all processes
-                for process in processes:
-                    process.terminate()
+                # Start peer nodes back to back, then wait for them together
+                for i in range(1, nodes):
+                    port = base_port + i
+                    print_info(f"Starting peer node {i} on port {port}...")
                     
-                for process in processes:
-                    process.wait()
+                    peer_cmd = [
+                        str(self.binary_path('core')),
+                        '--data-dir', f'./test-data/node-{i}',
+                        '--port', str(port),
+                        '--addnode', f'127.0.0.1:{base_port}',
+                        '--enable-api',
+                        '--api-port', str(port + 1000)
+                    ]
                     
-                print_success("Test network stopped")
-                return True
+                    processes.append(self._spawn_node(peer_cmd))
                 
-        except Exception as e:
-            print_error(f"Test network failed: {e}")
-            
-            # Cleanup processes
-            for process in processes:
+                for i in range(1, nodes):
+                    port = base_port + i
+                    if not wait_for_port(port):
+                        print_warning(f"Peer node {i} not accepting connections on port {port} yet")
+                
+                print_success(f"✅ {nodes}-node test network started!")
+                print_info("🔗 Genesis API: http://localhost:8080")
+                for i in range(1, nodes):
+                    print_info(f"🔗 Node {i} API: http://localhost:{8080 + i + 1000}")
+                    
+                print(f"\\n{Colors.YELLOW}Press Ctrl+C to stop test network{Colors.END}")
+                
+                # Wait for interrupt, reporting any node that dies meanwhile
                 try:
-                    process.terminate()
-                except:
-                    pass
+                    running = list(processes)
+                    while running:
+                        for process in wait_for_any_exit(running):
+                            running.remove(process)
+                            index = processes.index(process)
+                            name = "Genesis node" if index == 0 else f"Peer node {index}"
+                            print_warning(f"{name} exited with code {process.returncode}")
                     
-            return False
+                    print_error("All test nodes exited")
+                    return False
+                except KeyboardInterrupt:
+                    print(f"\\n{Colors.YELLOW}Stopping test network...{Colors.END}")
+                    
+                    # Stop all processes
+                    cleanup.close()
+                        
+                    print_success("Test network stopped")
+                    return True
+                    
+            except Exception as e:
+                print_error(f"Test network failed: {e}")
+                return False
+    
+    def _spawn_node(self, cmd: List[str]) -> subprocess.Popen:
+        """Spawn a node process detached from the terminal's signals."""
+        # No preexec_fn keeps CPython on the vfork fast path; the launcher
+        # stops nodes itself, so they get their own session instead of Ctrl+C
+        return subprocess.Popen(cmd, cwd=self.root_path, close_fds=True,
+                                start_new_session=True, stdin=subprocess.DEVNULL)
     
     def _run_stress_test(self) -> bool:
         """Run wallet stress test."""
         print_info("Starting wallet stress test...")
         
         try:
-            wallet_binary = self.release_path / f"paradigm-wallet{self.exe_suffix}"
+            wallet_binary = self.binary_path('wallet')
             cmd = [str(wallet_binary), 'stress-test', '100']
             
             subprocess.run(cmd, check=True, cwd=self.root_path)
@@ -437,9 +586,9 @@ class ParadigmLauncher:
     
     def wallet_command(self, args: List[str]) -> bool:
         """Execute wallet command."""
-        wallet_binary = self.release_path / f"paradigm-wallet{self.exe_suffix}"
+        wallet_binary = self.binary_path('wallet')
         
-        if not wallet_binary.exists():
+        if not self.binary_exists('wallet'):
             print_error("paradigm-wallet binary not found. Run 'build' first.")
             return False
         
@@ -458,17 +607,22 @@ class ParadigmLauncher:
         # Check if binaries exist
         print_info("Binary Status:")
         for name, binary in self.binaries.items():
-            path = self.release_path / f"{binary}{self.exe_suffix}"
-            status = "✅ Available" if path.exists() else "❌ Missing"
+            status = "✅ Available" if self.binary_exists(name) else "❌ Missing"
             print(f"  {binary}: {status}")
         
         # Check if network is running
         print_info("\\nNetwork Status:")
         try:
-            import requests
-            response = requests.get("http://localhost:8080/api/v1/network/status", timeout=2)
-            if response.status_code == 200:
-                data = response.json()
+            # Plain http.client avoids importing requests for a one-shot ping
+            conn = http.client.HTTPConnection("localhost", DEFAULT_API_PORT, timeout=2)
+            try:
+                conn.request("GET", "/api/v1/network/status")
+                response = conn.getresponse()
+                body = response.read()
+            finally:
+                conn.close()
+            if response.status == 200:
+                data = json.loads(body)
                 print_success("🌐 Network is running")
                 print(f"  Active peers: {data.get('active_peers', 'unknown')}")
                 print(f"  Network health: {data.get('health_score', 'unknown')}")
@@ -500,6 +654,7 @@ Examples:
     # Build command
     build_parser = subparsers.add_parser('build', help='Build the Paradigm system')
     build_parser.add_argument('--advanced', action='store_true', help='Enable all features')
+    build_parser.add_argument('--clean', action='store_true', help='Remove target directory before building')
     
     # Start command
     start_parser = subparsers.add_parser('start', help='Start Paradigm network')
@@ -536,7 +691,7 @@ Examples:
     
     try:
         if args.command == 'build':
-            success = launcher.build_system(advanced=args.advanced)
+            success = launcher.build_system(advanced=args.advanced, clean=args.clean)
         elif args.command == 'start':
             success = launcher.start_network(
                 genesis=args.genesis,
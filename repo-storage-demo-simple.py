@@ -11,96 +11,154 @@ import os
 import json
 import hashlib
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def calculate_repo_storage_cost(repo_path):
-    """Calculate the cost to store a repository on Paradigm network"""
+# Common ignore patterns (dot-prefixed entries are always skipped)
+SKIP_DIRS = frozenset({'node_modules', '__pycache__', 'target', 'snt-web', '.git', '.venv'})
+SKIP_EXTENSIONS = ('.pyc', '.o', '.exe', '.dll', '.so', '.dylib')
+
+# Storage pricing: 0.001 PAR per KB, at least 0.001 PAR per chunk
+COST_PER_BYTE = 0.001 / 1024
+MIN_CHUNK_COST = 0.001
+MAX_CHUNK_SIZE = 50000  # 50KB limit for demo
+
+def iter_files(path):
+    """Yield (DirEntry, position) for every file under path in os.walk order, honouring ignore patterns
+
+    position is the entry's index among all non-directory names in its directory,
+    as in os.walk's files list, including the ignored ones.
+    """
+    # A directory's own files come before anything in its subdirectories
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            position = 0
+            for entry in it:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()  # os.walk classifies symlinked dirs as dirs
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # ...but only descends into real ones
+                    if name[:1] != '.' and name not in SKIP_DIRS and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+                
+                index = position
+                position += 1
+                if name[:1] == '.' or name.endswith(SKIP_EXTENSIONS):
+                    continue
+                if entry.is_file():  # symlinked files count, as in os.walk
+                    yield entry, index
+    except OSError:
+        # Unreadable directories are skipped, as os.walk does
+        return
+    
+    for subdir in subdirs:
+        yield from iter_files(subdir)
+
+def scan_repo(repo_path, max_chunks=5):
+    """Walk the repository once, returning its cost analysis and chunk candidates"""
     total_size = 0
     file_count = 0
+    candidates = []
+    small_files = 0
     
     print("Analyzing repository structure...")
     
-    for root, dirs, files in os.walk(repo_path):
-        # Skip common ignore patterns
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__', 'target', 'snt-web']]
+    # iter_files paths all start with this prefix, so slicing gives the relpath
+    prefix_len = len(os.path.join(repo_path, ''))
+    
+    for entry, position in iter_files(repo_path):
+        try:
+            # DirEntry caches the stat result, no extra syscall per file
+            size = entry.stat().st_size
+        except OSError:
+            continue
         
-        for file in files:
-            if not file.startswith('.') and not file.endswith(('.pyc', '.o', '.exe', '.dll')):
-                filepath = os.path.join(root, file)
-                try:
-                    size = os.path.getsize(filepath)
-                    total_size += size
-                    file_count += 1
-                    
-                    # Show some files being processed
-                    if file_count <= 10:
-                        rel_path = os.path.relpath(filepath, repo_path)
-                        print(f"  - {rel_path} ({size} bytes)")
-                    elif file_count == 11:
-                        print(f"  ... and {len([f for r, _, fs in os.walk(repo_path) for f in fs]) - 10} more files")
-                        
-                except OSError:
-                    continue
+        total_size += size
+        file_count += 1
+        rel_path = entry.path[prefix_len:]
+        
+        # Show some files being processed
+        if file_count <= 10:
+            print(f"  - {rel_path} ({size} bytes)")
+        
+        # Sample only the first max_chunks names of each directory, until enough
+        # chunk-sized files are found (large ones are reported later)
+        if small_files < max_chunks and position < max_chunks:
+            candidates.append((entry.path, rel_path, size))
+            if size <= MAX_CHUNK_SIZE:
+                small_files += 1
+    
+    if file_count > 10:
+        print(f"  ... and {file_count - 10} more files")
     
     # Cost calculation (0.001 PAR per KB)
-    base_cost_per_kb = 0.001
-    cost_estimate = (total_size / 1024) * base_cost_per_kb
+    cost_estimate = total_size * COST_PER_BYTE
     
-    return {
+    cost_analysis = {
         "total_size_bytes": total_size,
         "total_size_kb": total_size / 1024,
         "file_count": file_count,
         "estimated_cost_par": round(cost_estimate, 6)
     }
+    return cost_analysis, candidates
+
+def sha256_file(f):
+    """Hash an open binary file without loading it into memory"""
+    if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+    h = hashlib.sha256()
+    for block in iter(lambda: f.read(65536), b''):
+        h.update(block)
+    return h.hexdigest()
+
+def hash_one(filepath):
+    """Hash a single file, returning None if it cannot be read"""
+    try:
+        with open(filepath, 'rb') as f:
+            return sha256_file(f)
+    except OSError:
+        return None
 
-def create_storage_chunks(repo_path, max_files=5):
-    """Create storage chunks for demonstration"""
+def create_storage_chunks(candidates):
+    """Create storage chunks for demonstration from scan_repo candidates"""
     chunks = []
     chunk_id = 1
     
     print("\nCreating storage chunks...")
     
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__', 'target', 'snt-web']]
+    # Hash the chunk-sized files concurrently; large ones are skipped for the demo
+    selected = [filepath for filepath, _, size in candidates if size <= MAX_CHUNK_SIZE]
+    
+    # hashlib releases the GIL while hashing, so threads scale across cores
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        hashes = executor.map(hash_one, selected)
         
-        for file in files[:max_files]:  # Limit for demo
-            if file.startswith('.') or file.endswith(('.pyc', '.o', '.exe')):
+        # Report in walk order, so skipped files appear between the chunks around them
+        for filepath, rel_filepath, size in candidates:
+            if size > MAX_CHUNK_SIZE:
+                print(f"  Skipping large file: {rel_filepath} ({size} bytes)")
                 continue
-                
-            filepath = os.path.join(root, file)
-            rel_filepath = os.path.relpath(filepath, repo_path)
             
-            try:
-                with open(filepath, 'rb') as f:
-                    content = f.read()
-                
-                # Skip large files for demo
-                if len(content) > 50000:  # 50KB limit for demo
-                    print(f"  Skipping large file: {rel_filepath} ({len(content)} bytes)")
-                    continue
-                
-                file_hash = hashlib.sha256(content).hexdigest()
-                
-                chunk = {
-                    "chunk_id": f"chunk_{chunk_id:03d}",
-                    "path": rel_filepath,
-                    "size": len(content),
-                    "hash": file_hash[:16],  # Short hash for display
-                    "storage_cost_par": max(0.001, (len(content) / 1024) * 0.001)
-                }
-                
-                chunks.append(chunk)
-                print(f"  Created chunk {chunk_id}: {rel_filepath} ({len(content)} bytes, {chunk['storage_cost_par']:.6f} PAR)")
-                chunk_id += 1
-                
-                if chunk_id > max_files:
-                    break
-                    
-            except (OSError, UnicodeDecodeError):
+            file_hash = next(hashes)
+            if file_hash is None:
                 continue
-        
-        if chunk_id > max_files:
-            break
+            
+            chunk = {
+                "chunk_id": f"chunk_{chunk_id:03d}",
+                "path": rel_filepath,
+                "size": size,
+                "hash": file_hash[:16],  # Short hash for display
+                "storage_cost_par": max(MIN_CHUNK_COST, size * COST_PER_BYTE)
+            }
+            
+            chunks.append(chunk)
+            print(f"  Created chunk {chunk_id}: {rel_filepath} ({size} bytes, {chunk['storage_cost_par']:.6f} PAR)")
+            chunk_id += 1
     
     return chunks
 
@@ -116,8 +174,8 @@ def main():
     print(f"Path: {os.path.abspath(repo_path)}")
     print()
     
-    # Calculate storage cost
-    cost_analysis = calculate_repo_storage_cost(repo_path)
+    # Calculate storage cost and pick sample files in a single pass
+    cost_analysis, candidates = scan_repo(repo_path, max_chunks=5)
     print(f"\nStorage Analysis:")
     print(f"  Files found: {cost_analysis['file_count']}")
     print(f"  Total size: {cost_analysis['total_size_kb']:.2f} KB ({cost_analysis['total_size_bytes']:,} bytes)")
@@ -125,7 +183,7 @@ def main():
     print()
     
     # Create sample chunks
-    chunks = create_storage_chunks(repo_path, max_files=5)
+    chunks = create_storage_chunks(candidates)
     
     print(f"\nSample Storage Chunks Created: {len(chunks)}")
     total_chunk_cost = sum(chunk['storage_cost_par'] for chunk in chunks)
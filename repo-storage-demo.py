@@ -10,36 +10,238 @@ Author: Claude Code Assistant
 """
 
 import os
+import sys
 import json
+import asyncio
 import hashlib
 import base64
-import requests
+import mmap
+import sqlite3
+import importlib.util
+import logging
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+# HTTP/2 multiplexes concurrent chunk uploads over one connection when h2 is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+try:
+    import orjson  # Optional: much faster serialization of large chunk payloads
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard  # Optional: compress file content before encoding (source code shrinks 3-5x)
+except ImportError:
+    zstandard = None
+
+# How chunk content is encoded on the wire, recorded in the manifest for decoders
+CONTENT_ENCODING = "zstd+base64" if zstandard else "base64"
+ZSTD_LEVEL = 3
+
+try:
+    from tqdm import tqdm  # Optional: progress bar for chunk submission
+except ImportError:
+    tqdm = None
+
+logger = logging.getLogger(__name__)
+
+# Common ignore patterns (dot-prefixed entries are always skipped)
+IGNORE_DIRS = frozenset({'node_modules', '__pycache__', 'target'})
+IGNORE_EXTENSIONS = ('.pyc', '.o', '.exe', '.dll')
+
+MIME_TYPES = {
+    '.py': 'text/x-python',
+    '.js': 'application/javascript',
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.rs': 'text/x-rust',
+    '.cpp': 'text/x-c++src',
+    '.h': 'text/x-chdr',
+    '.json': 'application/json',
+    '.md': 'text/markdown',
+    '.txt': 'text/plain',
+}
+
+# Multiple of 3 so each block base64-encodes without padding and parts concatenate
+READ_BLOCK_SIZE = 3 * 21845  # ~64 KiB
+
+# Below this, mapping a file costs more syscalls than reading it
+MMAP_THRESHOLD = 64 * 1024
+
+# OpenSSL's SHA-256 uses the CPU's SHA extensions (SHA-NI / ARMv8) when present;
+# CPython's builtin fallback is portable C and several times slower
+SHA256_BACKEND = "openssl" if type(hashlib.sha256()).__module__ == "_hashlib" else "builtin"
+
+def iter_repo_files(root: str, dirs: Optional[List[str]] = None) -> Iterator[os.DirEntry]:
+    """Yield files under root in os.walk order, optionally collecting visited directories"""
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        if dirs is not None and current != root:
+            dirs.append(current)
+        
+        subdirs = []
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name
+                    if name[0] == '.':  # scandir never yields empty names
+                        continue
+                    # DirEntry type checks come from getdents; only symlinks need a stat.
+                    # Symlinked files are listed like os.walk does, symlinked dirs are not entered.
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in IGNORE_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        if not name.endswith(IGNORE_EXTENSIONS):
+                            yield entry
+        except OSError:
+            continue
+        
+        stack.extend(reversed(subdirs))
+
+# (relative path, path, size, mtime_ns) for each file found by a repository walk
+FileRecord = Tuple[str, str, int, int]
+
+def collect_repo_files(root: str, dirs: Optional[List[str]] = None) -> List[FileRecord]:
+    """Walk root once, recording each file's relative path, path, size and mtime"""
+    records = []
+    for entry in iter_repo_files(root, dirs):
+        try:
+            # The only stat per file; hashing and the hash cache reuse it
+            st = entry.stat()
+        except OSError:
+            continue
+        records.append((os.path.relpath(entry.path, root), entry.path, st.st_size, st.st_mtime_ns))
+    return records
+
+def file_suffix(name: str) -> str:
+    """Lowercased extension of a file name, matching Path.suffix without building a Path"""
+    i = name.rfind('.')
+    return name[i:].lower() if 0 < i < len(name) - 1 else ''
+
+def advise_sequential(f) -> None:
+    """Tell the kernel a file will be read front to back so readahead overlaps hashing"""
+    if hasattr(os, 'posix_fadvise'):  # Linux/BSD only
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def sha256_file(f, size: Optional[int] = None) -> str:
+    """Hash an open binary file from the start, given its size if already known"""
+    if size is None:
+        size = os.fstat(f.fileno()).st_size
+    if size >= MMAP_THRESHOLD:
+        try:
+            # Hash straight from the page cache, no copy into a Python buffer
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        except (OSError, ValueError):
+            pass  # Not mappable (e.g. special files) - read it instead
+    
+    if sys.version_info >= (3, 11):
+        # Read loop runs in C with the GIL released
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+    
+    sha256 = hashlib.sha256()
+    for block in iter(lambda: f.read(READ_BLOCK_SIZE), b''):
+        sha256.update(block)
+    return sha256.hexdigest()
+
+def sha256_json(obj: Any) -> str:
+    """Hash json.dumps(obj, sort_keys=True)"""
+    # One-shot dumps runs the C encoder; iterencode would fall back to pure Python
+    return hashlib.sha256(json.dumps(obj, sort_keys=True).encode('utf-8')).hexdigest()
+
+def dumps_payload(obj: Any) -> str:
+    """Serialize a task payload to JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+def iter_base64(f) -> Iterator[str]:
+    """Base64-encode an open binary file block by block"""
+    for block in iter(lambda: f.read(READ_BLOCK_SIZE), b''):
+        yield base64.b64encode(block).decode('ascii')
+
+# Per-file hash memo so unchanged files are not rehashed on re-runs
+DEFAULT_HASH_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "paradigm", "manifest_cache.sqlite")
+
+class FileHashCache:
+    """Persistent SHA-256 cache keyed by (absolute path, mtime_ns, size)"""
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.entries: Dict[str, Tuple[int, int, str]] = {}
+        self.updates: List[Tuple[str, int, int, str]] = []
+    
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE IF NOT EXISTS file_hashes ("
+                     "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, sha256 TEXT)")
+        return conn
+    
+    def load(self) -> None:
+        """Read the whole cache into memory so worker threads never touch sqlite"""
+        try:
+            conn = self._connect()
+            try:
+                for path, mtime_ns, size, sha256 in conn.execute("SELECT path, mtime_ns, size, sha256 FROM file_hashes"):
+                    self.entries[path] = (mtime_ns, size, sha256)
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Hash cache unavailable, hashing all files: {e}")
+    
+    def lookup(self, path: str, mtime_ns: int, size: int) -> Optional[str]:
+        """Return the cached hash if the file is unchanged since it was recorded"""
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == mtime_ns and entry[1] == size:
+            return entry[2]
+        return None
+    
+    def record(self, path: str, mtime_ns: int, size: int, sha256: str) -> None:
+        """Remember a freshly computed hash (written out by save)"""
+        self.updates.append((path, mtime_ns, size, sha256))
+    
+    def save(self) -> None:
+        """Write new and changed entries back in a single transaction"""
+        if not self.updates:
+            return
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?)", self.updates)
+            finally:
+                conn.close()
+            self.updates = []
+        except (sqlite3.Error, OSError) as e:
+            print(f"Could not update hash cache: {e}")
 
 class ParadigmRepoStorage:
-    def __init__(self, node_url: str = "http://127.0.0.1:8080"):
+    def __init__(self, node_url: str = "http://127.0.0.1:8080",
+                 hash_cache_path: Optional[str] = DEFAULT_HASH_CACHE_PATH):
         self.node_url = node_url
         self.api_base = f"{node_url}/api"
+        self.hash_cache_path = hash_cache_path
         
-    def calculate_storage_cost(self, repo_path: str) -> Dict[str, Any]:
-        """Calculate the cost to store a repository"""
-        total_size = 0
-        file_count = 0
+    def calculate_storage_cost(self, repo_path: str,
+                               files: Optional[List[FileRecord]] = None) -> Dict[str, Any]:
+        """Calculate the cost to store a repository, reusing collected files if given"""
+        if files is None:
+            files = collect_repo_files(repo_path)
         
-        for root, dirs, files in os.walk(repo_path):
-            # Skip common ignore patterns
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__', 'target']]
-            
-            for file in files:
-                if not file.startswith('.') and not file.endswith(('.pyc', '.o', '.exe')):
-                    filepath = os.path.join(root, file)
-                    try:
-                        size = os.path.getsize(filepath)
-                        total_size += size
-                        file_count += 1
-                    except OSError:
-                        continue
+        sizes = [size for _, _, size, _ in files]
+        total_size = sum(sizes)
+        file_count = len(sizes)
         
         # Cost calculation
         base_cost_per_kb = 0.001  # PAR tokens per KB
@@ -53,8 +255,10 @@ class ParadigmRepoStorage:
             "storage_method": "chunked_tasks"
         }
     
-    def create_repository_manifest(self, repo_path: str, repo_name: str) -> Dict[str, Any]:
-        """Create a repository manifest with metadata"""
+    def create_repository_manifest(self, repo_path: str, repo_name: str,
+                                   files: Optional[List[FileRecord]] = None,
+                                   directories: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Create a repository manifest with metadata, reusing a collect_repo_files walk if given"""
         repo_path = Path(repo_path)
         
         manifest = {
@@ -70,89 +274,98 @@ class ParadigmRepoStorage:
             "chunks": []
         }
         
-        chunk_id = 1
+        # Walk the tree here unless the caller already did; hashing runs on a thread pool
+        if files is None:
+            directories = []
+            files = collect_repo_files(str(repo_path), directories)
         
-        for root, dirs, files in os.walk(repo_path):
-            # Skip ignored directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__', 'target', '.git']]
-            
-            rel_root = os.path.relpath(root, repo_path)
-            if rel_root == '.':
-                rel_root = ''
-            
-            # Add directory to structure
-            if rel_root:
-                manifest["structure"][rel_root] = "directory"
+        # Add directories to structure
+        for directory in directories or ():
+            manifest["structure"][os.path.relpath(directory, repo_path)] = "directory"
+        
+        hash_cache = None
+        if self.hash_cache_path:
+            hash_cache = FileHashCache(self.hash_cache_path)
+            hash_cache.load()
+        
+        # hashlib releases the GIL, so reads and hashes overlap across threads.
+        # Largest files are queued first so no big file is left running alone at the end.
+        order = sorted(range(len(files)), key=lambda i: files[i][2], reverse=True)
+        results = [None] * len(files)
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            hashed = executor.map(lambda i: self._process_file(*files[i], hash_cache), order)
+            for i, result in zip(order, hashed):
+                results[i] = result
+        
+        if hash_cache:
+            hash_cache.save()
+        
+        # Number chunks in walk order so the manifest is stable between runs
+        chunk_id = 1
+        for result in results:
+            if result is None:
+                continue
             
-            for file in files:
-                if file.startswith('.') or file.endswith(('.pyc', '.o', '.exe', '.dll')):
-                    continue
-                    
-                filepath = os.path.join(root, file)
-                rel_filepath = os.path.relpath(filepath, repo_path)
-                
-                try:
-                    with open(filepath, 'rb') as f:
-                        content = f.read()
-                    
-                    # Calculate hash
-                    file_hash = hashlib.sha256(content).hexdigest()
-                    
-                    # Encode content
-                    encoded_content = base64.b64encode(content).decode('utf-8')
-                    
-                    # Create file entry
-                    manifest["files"][rel_filepath] = {
-                        "size": len(content),
-                        "hash": file_hash,
-                        "chunk_id": f"chunk_{chunk_id:03d}",
-                        "encoding": "base64"
-                    }
-                    
-                    # Create storage chunk
-                    chunk = {
-                        "chunk_id": f"chunk_{chunk_id:03d}",
-                        "task_type": "repository_file_storage",
-                        "path": rel_filepath,
-                        "content": encoded_content,
-                        "metadata": {
-                            "size": len(content),
-                            "hash": file_hash,
-                            "mime_type": self.guess_mime_type(file)
-                        }
-                    }
-                    
-                    manifest["chunks"].append(chunk)
-                    chunk_id += 1
-                    
-                except (OSError, UnicodeDecodeError):
-                    print(f"Skipping unreadable file: {rel_filepath}")
-                    continue
+            rel_filepath, file_entry, chunk = result
+            file_entry["chunk_id"] = chunk["chunk_id"] = f"chunk_{chunk_id:03d}"
+            manifest["files"][rel_filepath] = file_entry
+            manifest["chunks"].append(chunk)
+            chunk_id += 1
         
         return manifest
     
-    def guess_mime_type(self, filename: str) -> str:
-        """Guess MIME type from filename"""
-        ext_map = {
-            '.py': 'text/x-python',
-            '.js': 'application/javascript',
-            '.html': 'text/html',
-            '.css': 'text/css',
-            '.rs': 'text/x-rust',
-            '.cpp': 'text/x-c++src',
-            '.h': 'text/x-chdr',
-            '.json': 'application/json',
-            '.md': 'text/markdown',
-            '.txt': 'text/plain',
+    def _process_file(self, rel_filepath: str, filepath: str, size: int, mtime_ns: int,
+                      hash_cache: Optional[FileHashCache] = None) -> Optional[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        """Hash one collected file into its manifest entry and storage chunk"""
+        # Content is not kept here - it is read and encoded when the chunk is submitted
+        try:
+            abs_path = os.path.abspath(filepath)
+            file_hash = hash_cache.lookup(abs_path, mtime_ns, size) if hash_cache else None
+            if file_hash is None:
+                with open(filepath, 'rb') as f:
+                    advise_sequential(f)
+                    file_hash = sha256_file(f, size)
+                if hash_cache:
+                    hash_cache.record(abs_path, mtime_ns, size, file_hash)
+        except OSError:
+            print(f"Skipping unreadable file: {rel_filepath}")
+            return None
+        
+        # Create file entry
+        file_entry = {
+            "size": size,
+            "hash": file_hash,
+            "chunk_id": None,
+            "encoding": CONTENT_ENCODING
+        }
+        
+        # Create storage chunk
+        chunk = {
+            "chunk_id": None,
+            "task_type": "repository_file_storage",
+            "path": rel_filepath,
+            "metadata": {
+                "size": size,
+                "hash": file_hash,
+                "mime_type": self.guess_mime_type(os.path.basename(filepath))
+            }
         }
         
-        ext = Path(filename).suffix.lower()
-        return ext_map.get(ext, 'application/octet-stream')
+        return rel_filepath, file_entry, chunk
     
-    def submit_repository_to_network(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
-        """Submit repository chunks to the Paradigm network as tasks"""
+    def guess_mime_type(self, filename: str) -> str:
+        """Guess MIME type from filename"""
+        return MIME_TYPES.get(file_suffix(filename), 'application/octet-stream')
+    
+    def submit_repository_to_network(self, manifest: Dict[str, Any], repo_path: str,
+                                     concurrency: int = 16) -> Dict[str, Any]:
+        """Submit repository chunks to the Paradigm network as tasks, reading files from repo_path"""
+        # Local paths stay out of the manifest so its hash does not depend on the checkout
+        file_paths = {chunk["chunk_id"]: os.path.join(repo_path, chunk["path"])
+                      for chunk in manifest["chunks"]}
+        
         results = {
-            "manifest_hash": hashlib.sha256(json.dumps(manifest, sort_keys=True).encode()).hexdigest(),
+            "manifest_hash": sha256_json(manifest),
             "submitted_chunks": [],
             "failed_chunks": [],
             "total_cost": 0.0
@@ -160,40 +373,89 @@ class ParadigmRepoStorage:
         
         print(f"📦 Submitting {len(manifest['chunks'])} chunks to Paradigm network...")
         
-        for i, chunk in enumerate(manifest["chunks"]):
-            print(f"📤 Submitting chunk {i+1}/{len(manifest['chunks'])}: {chunk['path']}")
-            
-            # Create task submission
-            task_data = {
-                "task_id": f"repo_storage_{chunk['chunk_id']}",
-                "task_type": "repository_file_storage", 
-                "difficulty": 1,
-                "data": json.dumps(chunk),
-                "reward": self.calculate_chunk_reward(len(chunk["content"])),
-                "timestamp": 1725282300  # Current timestamp
-            }
-            
-            try:
-                # Submit to network API (simulated)
-                success = self.submit_task(task_data)
-                
-                if success:
-                    results["submitted_chunks"].append({
-                        "chunk_id": chunk["chunk_id"],
-                        "path": chunk["path"],
-                        "size": chunk["metadata"]["size"],
-                        "cost": task_data["reward"] / 1000000000  # Convert to PAR
-                    })
-                    results["total_cost"] += task_data["reward"] / 1000000000
-                else:
-                    results["failed_chunks"].append(chunk["chunk_id"])
-                    
-            except Exception as e:
-                print(f"❌ Failed to submit {chunk['path']}: {str(e)}")
+        rewards = asyncio.run(self.submit_chunks_batch(manifest["chunks"], file_paths, concurrency))
+        
+        for chunk, reward in zip(manifest["chunks"], rewards):
+            if reward is not None:
+                results["submitted_chunks"].append({
+                    "chunk_id": chunk["chunk_id"],
+                    "path": chunk["path"],
+                    "size": chunk["metadata"]["size"],
+                    "cost": reward / 1000000000  # Convert to PAR
+                })
+                results["total_cost"] += reward / 1000000000
+            else:
                 results["failed_chunks"].append(chunk["chunk_id"])
         
         return results
     
+    async def submit_chunks_batch(self, chunks: List[Dict[str, Any]], file_paths: Dict[str, str],
+                                  concurrency: int = 16) -> List[Optional[int]]:
+        """Submit chunks concurrently over a shared client, returning each reward or None on failure"""
+        semaphore = asyncio.Semaphore(concurrency)
+        # Per-chunk detail goes to the debug log; the terminal only sees the bar
+        progress = tqdm(total=len(chunks), desc="submit", unit="chunk") if tqdm else None
+        
+        async with httpx.AsyncClient(base_url=self.api_base, http2=HTTP2_AVAILABLE, timeout=30.0) as client:
+            async def submit_one(i: int, chunk: Dict[str, Any]) -> Optional[int]:
+                # The semaphore also bounds how many encoded payloads are in memory
+                async with semaphore:
+                    logger.debug("Submitting chunk %d/%d: %s", i + 1, len(chunks), chunk['path'])
+                    try:
+                        task_data = await asyncio.to_thread(
+                            self.build_task_data, chunk, file_paths[chunk["chunk_id"]])
+                        if await self.submit_task(client, task_data):
+                            return task_data["reward"]
+                    except Exception as e:
+                        logger.warning("Failed to submit %s: %s", chunk['path'], e)
+                    finally:
+                        if progress is not None:
+                            progress.update(1)
+                    return None
+            
+            try:
+                return await asyncio.gather(*(submit_one(i, chunk) for i, chunk in enumerate(chunks)))
+            finally:
+                if progress is not None:
+                    progress.close()
+    
+    def build_task_data(self, chunk: Dict[str, Any], file_path: str) -> Dict[str, Any]:
+        """Create the task submission for a chunk, encoding its file now"""
+        payload = self.load_chunk_payload(chunk, file_path)
+        
+        return {
+            "task_id": f"repo_storage_{chunk['chunk_id']}",
+            "task_type": "repository_file_storage", 
+            "difficulty": 1,
+            "data": dumps_payload(payload),
+            # Priced on the bytes actually sent, i.e. after compression
+            "reward": self.calculate_chunk_reward(len(payload["content"])),
+            "timestamp": 1725282300  # Current timestamp
+        }
+    
+    def load_chunk_payload(self, chunk: Dict[str, Any], file_path: str) -> Dict[str, Any]:
+        """Read and encode a chunk's file from file_path into the payload sent to the network"""
+        metadata = dict(chunk["metadata"], encoding=CONTENT_ENCODING)
+        with open(file_path, 'rb') as f:
+            advise_sequential(f)
+            if zstandard:
+                # Compressors are not thread-safe and payloads are built on worker threads
+                content = f.read()
+                compressed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(content)
+                encoded_content = base64.b64encode(compressed).decode('ascii')
+                metadata["original_size"] = len(content)
+                metadata["compressed_size"] = len(compressed)
+            else:
+                encoded_content = ''.join(iter_base64(f))
+        
+        return {
+            "chunk_id": chunk["chunk_id"],
+            "task_type": chunk["task_type"],
+            "path": chunk["path"],
+            "content": encoded_content,
+            "metadata": metadata
+        }
+    
     def calculate_chunk_reward(self, content_size: int) -> int:
         """Calculate reward in smallest PAR units for storing a chunk"""
         # Base cost: 0.001 PAR per KB
@@ -201,24 +463,22 @@ class ParadigmRepoStorage:
         par_cost = max(0.001, kb_size * 0.001)  # Minimum 0.001 PAR
         return int(par_cost * 1000000000)  # Convert to smallest units
     
-    def submit_task(self, task_data: Dict[str, Any]) -> bool:
+    async def submit_task(self, client: httpx.AsyncClient, task_data: Dict[str, Any]) -> bool:
         """Submit a task to the Paradigm network"""
         try:
-            # In a real implementation, this would POST to the API
-            # For demo purposes, we'll simulate success
-            url = f"{self.api_base}/tasks/submit"
+            logger.debug("POST %s/tasks/submit", self.api_base)
+            logger.debug("Task size: %d bytes", len(task_data['data']))
+            logger.debug("Reward: %.6f PAR", task_data['reward'] / 1000000000)
             
-            # Simulate network call (replace with actual HTTP request)
-            print(f"  → Simulating POST to {url}")
-            print(f"  → Task size: {len(task_data['data'])} bytes")
-            print(f"  → Reward: {task_data['reward'] / 1000000000:.6f} PAR")
+            response = await client.post(
+                "/tasks/submit",
+                content=dumps_payload(task_data),
+                headers={"Content-Type": "application/json"}
+            )
+            return response.is_success
             
-            # Simulate success (90% success rate)
-            import random
-            return random.random() > 0.1
-            
-        except Exception as e:
-            print(f"Network error: {str(e)}")
+        except httpx.HTTPError as e:
+            logger.warning("Network error: %s", e)
             return False
 
 def main():
@@ -234,9 +494,15 @@ def main():
     repo_name = "paradigm-network-demo"
     
     print(f"📁 Analyzing repository: {repo_name}")
+    if SHA256_BACKEND != "openssl":
+        print("⚠️  Python's hashlib is not backed by OpenSSL - hashing will be slower")
+    
+    # Walk the repository once for both the cost estimate and the manifest
+    directories = []
+    files = collect_repo_files(repo_path, directories)
     
     # Calculate storage cost
-    cost_analysis = storage.calculate_storage_cost(repo_path)
+    cost_analysis = storage.calculate_storage_cost(repo_path, files)
     print(f"📊 Storage Analysis:")
     print(f"   • Files: {cost_analysis['file_count']}")
     print(f"   • Size: {cost_analysis['total_size_kb']:.2f} KB")
@@ -245,7 +511,7 @@ def main():
     
     # Create repository manifest
     print("📋 Creating repository manifest...")
-    manifest = storage.create_repository_manifest(repo_path, repo_name)
+    manifest = storage.create_repository_manifest(repo_path, repo_name, files, directories)
     
     print(f"✅ Manifest created:")
     print(f"   • Repository: {manifest['repository']['name']}")
@@ -253,9 +519,9 @@ def main():
     print(f"   • Chunks: {len(manifest['chunks'])}")
     print()
     
-    # Simulate submission to network
+    # Submit chunks to the network
     print("🚀 Submitting to Paradigm network...")
-    results = storage.submit_repository_to_network(manifest)
+    results = storage.submit_repository_to_network(manifest, repo_path)
     
     print(f"📈 Submission Results:")
     print(f"   • Manifest hash: {results['manifest_hash'][:16]}...")
@@ -60,6 +60,9 @@ setup(
         "websocket": [
             "websockets>=11.0",
         ],
+        "msgspec": [
+            "msgspec>=0.18",
+        ],
     },
     keywords=[
         "paradigm",
@@ -7,13 +7,20 @@ network via REST API endpoints.
 
 import asyncio
 import logging
+from collections import deque
 from typing import Dict, List, Optional, Union, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
 import json
+import threading
 import time
 
 import httpx
-from httpx import AsyncClient, Client
+from httpx import AsyncClient
+
+try:
+    import msgspec
+except ImportError:  # optional: faster request serialization
+    msgspec = None
 
 from .exceptions import ParadigmError, NetworkError, ValidationError, RateLimitError
 from .types import (
@@ -26,6 +33,22 @@ from .constants import API_VERSION, NETWORKS
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _request_body(request: Any) -> Dict[str, Any]:
+    """Build httpx body arguments for a request object.
+
+    Request types defined as ``msgspec.Struct`` are encoded straight to JSON
+    bytes; dataclass requests fall back to their declared fields.
+    """
+    if msgspec is not None and isinstance(request, msgspec.Struct):
+        return {"content": msgspec.json.encode(request), "headers": _JSON_HEADERS}
+    if is_dataclass(request):
+        # Shallow copy of the declared fields; asdict() would deep-copy every value
+        return {"json": {f.name: getattr(request, f.name) for f in fields(request)}}
+    return {"json": request}
+
 
 @dataclass
 class ClientConfig:
@@ -37,6 +60,10 @@ class ClientConfig:
     network: str = "mainnet"
     rate_limit_requests: int = 100
     rate_limit_window: int = 60  # seconds
+    http2: bool = True
+    max_connections: int = 128
+    max_keepalive_connections: int = 64
+    keepalive_expiry: float = 30.0  # seconds
 
 
 class ParadigmClient:
@@ -65,6 +92,10 @@ class ParadigmClient:
             self.config = config
             
         self._setup_http_client()
+        # Sync methods run on a private event loop thread, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
         self._rate_limiter = RateLimiter(
             self.config.rate_limit_requests,
             self.config.rate_limit_window
@@ -79,18 +110,26 @@ class ParadigmClient:
         
         if self.config.api_key:
             headers["X-API-Key"] = self.config.api_key
-            
-        self._client = Client(
-            base_url=f"{self.config.base_url}/api/{API_VERSION}",
-            headers=headers,
-            timeout=self.config.timeout,
+        
+        # Keep connections alive across requests. The client builds its own
+        # transport so HTTP(S)_PROXY from the environment is still honoured.
+        limits = httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
         )
         
-        self._async_client = AsyncClient(
+        # Connections are bound to the event loop that opens them, so sync
+        # methods (run on the client's own loop) get a separate pool
+        client_options = dict(
             base_url=f"{self.config.base_url}/api/{API_VERSION}",
             headers=headers,
             timeout=self.config.timeout,
+            http2=self.config.http2,
+            limits=limits,
         )
+        self._async_client = AsyncClient(**client_options)
+        self._sync_client = AsyncClient(**client_options)
 
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Handle HTTP response and convert errors."""
@@ -112,51 +151,37 @@ class ParadigmClient:
             
         return data.get("data", {})
 
-    def _make_request(
-        self, 
-        method: str, 
-        endpoint: str, 
-        params: Optional[Dict] = None,
-        json_data: Optional[Dict] = None
-    ) -> Dict[str, Any]:
-        """Make HTTP request with retry logic."""
-        self._rate_limiter.wait_if_needed()
-        
-        for attempt in range(self.config.retries + 1):
-            try:
-                response = self._client.request(
-                    method=method,
-                    url=endpoint,
-                    params=params,
-                    json=json_data
+    def _run_sync(self, coro: Any) -> Any:
+        """Run a coroutine on the client's event loop thread and wait for its result."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="paradigm-sdk-loop",
+                    daemon=True,
                 )
-                return self._handle_response(response)
-                
-            except (httpx.ConnectError, httpx.TimeoutException) as e:
-                if attempt == self.config.retries:
-                    raise NetworkError(f"Request failed after {self.config.retries} retries: {e}")
-                    
-                wait_time = 2 ** attempt
-                logger.warning(f"Request failed, retrying in {wait_time}s... (attempt {attempt + 1})")
-                time.sleep(wait_time)
+                self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
 
     async def _make_async_request(
         self, 
         method: str, 
         endpoint: str, 
         params: Optional[Dict] = None,
-        json_data: Optional[Dict] = None
+        json_data: Optional[Any] = None
     ) -> Dict[str, Any]:
         """Make async HTTP request with retry logic."""
         await self._rate_limiter.async_wait_if_needed()
+        client = self._sync_client if asyncio.get_running_loop() is self._loop else self._async_client
         
         for attempt in range(self.config.retries + 1):
             try:
-                response = await self._async_client.request(
+                response = await client.request(
                     method=method,
                     url=endpoint,
                     params=params,
-                    json=json_data
+                    **_request_body(json_data)
                 )
                 return self._handle_response(response)
                 
@@ -172,7 +197,7 @@ class ParadigmClient:
     
     def get_health(self) -> Dict[str, Any]:
         """Get API health status."""
-        return self._make_request("GET", "/health")
+        return self._run_sync(self._make_async_request("GET", "/health"))
 
     async def get_health_async(self) -> Dict[str, Any]:
         """Get API health status (async)."""
@@ -180,7 +205,7 @@ class ParadigmClient:
 
     def get_network_stats(self) -> NetworkStats:
         """Get network statistics."""
-        data = self._make_request("GET", "/analytics/network-stats")
+        data = self._run_sync(self._make_async_request("GET", "/analytics/network-stats"))
         return NetworkStats(**data)
 
     async def get_network_stats_async(self) -> NetworkStats:
@@ -195,7 +220,7 @@ class ParadigmClient:
         if not validate_address(address):
             raise ValidationError("Invalid address format")
             
-        data = self._make_request("GET", f"/accounts/{address}")
+        data = self._run_sync(self._make_async_request("GET", f"/accounts/{address}"))
         return Account(**data)
 
     async def get_account_async(self, address: str) -> Account:
@@ -211,7 +236,7 @@ class ParadigmClient:
         if not validate_address(address):
             raise ValidationError("Invalid address format")
             
-        return self._make_request("GET", f"/accounts/{address}/balance")
+        return self._run_sync(self._make_async_request("GET", f"/accounts/{address}/balance"))
 
     async def get_balance_async(self, address: str) -> Dict[str, str]:
         """Get account balance (async)."""
@@ -224,7 +249,7 @@ class ParadigmClient:
     
     def get_transaction(self, hash: str) -> Transaction:
         """Get transaction by hash."""
-        data = self._make_request("GET", f"/transactions/{hash}")
+        data = self._run_sync(self._make_async_request("GET", f"/transactions/{hash}"))
         return Transaction(**data)
 
     async def get_transaction_async(self, hash: str) -> Transaction:
@@ -239,7 +264,7 @@ class ParadigmClient:
         if not validate_amount(request.amount):
             raise ValidationError("Invalid amount")
             
-        data = self._make_request("POST", "/transactions", json_data=request.__dict__)
+        data = self._run_sync(self._make_async_request("POST", "/transactions", json_data=request))
         return Transaction(**data)
 
     async def create_transaction_async(self, request: CreateTransactionRequest) -> Transaction:
@@ -249,19 +274,19 @@ class ParadigmClient:
         if not validate_amount(request.amount):
             raise ValidationError("Invalid amount")
             
-        data = await self._make_async_request("POST", "/transactions", json_data=request.__dict__)
+        data = await self._make_async_request("POST", "/transactions", json_data=request)
         return Transaction(**data)
 
     def send_signed_transaction(self, signed_transaction: str) -> Transaction:
         """Send a signed transaction."""
-        data = self._make_request("POST", "/transactions/send", json_data={
+        data = self._run_sync(self._make_async_request("POST", "/transactions/send", json_data={
             "signed_transaction": signed_transaction
-        })
+        }))
         return Transaction(**data)
 
     def estimate_fee(self, request: CreateTransactionRequest) -> FeeEstimate:
         """Estimate transaction fee."""
-        data = self._make_request("POST", "/transactions/estimate-fee", json_data=request.__dict__)
+        data = self._run_sync(self._make_async_request("POST", "/transactions/estimate-fee", json_data=request))
         return FeeEstimate(**data)
 
     def get_transactions(
@@ -274,7 +299,7 @@ class ParadigmClient:
         params = {"page": page, "page_size": page_size}
         
         endpoint = f"/addresses/{address}/transactions" if address else "/transactions"
-        data = self._make_request("GET", endpoint, params=params)
+        data = self._run_sync(self._make_async_request("GET", endpoint, params=params))
         
         return PaginatedResponse(
             items=[Transaction(**item) for item in data["items"]],
@@ -290,24 +315,24 @@ class ParadigmClient:
     
     def get_latest_block(self) -> Block:
         """Get the latest block."""
-        data = self._make_request("GET", "/blockchain/latest-block")
+        data = self._run_sync(self._make_async_request("GET", "/blockchain/latest-block"))
         return Block(**data)
 
     def get_block(self, height: int) -> Block:
         """Get block by height."""
-        data = self._make_request("GET", f"/blockchain/blocks/{height}")
+        data = self._run_sync(self._make_async_request("GET", f"/blockchain/blocks/{height}"))
         return Block(**data)
 
     # ML Task Methods
     
     def create_ml_task(self, request: MLTaskRequest) -> MLTask:
         """Create a new ML task."""
-        data = self._make_request("POST", "/ml-tasks", json_data=request.__dict__)
+        data = self._run_sync(self._make_async_request("POST", "/ml-tasks", json_data=request))
         return MLTask(**data)
 
     def get_ml_task(self, task_id: str) -> MLTask:
         """Get ML task by ID."""
-        data = self._make_request("GET", f"/ml-tasks/{task_id}")
+        data = self._run_sync(self._make_async_request("GET", f"/ml-tasks/{task_id}"))
         return MLTask(**data)
 
     def get_ml_tasks(
@@ -321,7 +346,7 @@ class ParadigmClient:
         if status:
             params["status"] = status
             
-        data = self._make_request("GET", "/ml-tasks", params=params)
+        data = self._run_sync(self._make_async_request("GET", "/ml-tasks", params=params))
         
         return PaginatedResponse(
             items=[MLTask(**item) for item in data["items"]],
@@ -337,31 +362,51 @@ class ParadigmClient:
     
     def create_proposal(self, request: CreateProposalRequest) -> Proposal:
         """Create a new governance proposal."""
-        data = self._make_request("POST", "/governance/proposals", json_data=request.__dict__)
+        data = self._run_sync(self._make_async_request("POST", "/governance/proposals", json_data=request))
         return Proposal(**data)
 
     def get_proposal(self, proposal_id: str) -> Proposal:
         """Get proposal by ID."""
-        data = self._make_request("GET", f"/governance/proposals/{proposal_id}")
+        data = self._run_sync(self._make_async_request("GET", f"/governance/proposals/{proposal_id}"))
         return Proposal(**data)
 
     def vote(self, proposal_id: str, option: str) -> None:
         """Vote on a proposal."""
-        self._make_request("POST", f"/governance/proposals/{proposal_id}/vote", json_data={
+        self._run_sync(self._make_async_request("POST", f"/governance/proposals/{proposal_id}/vote", json_data={
             "option": option
-        })
+        }))
 
     # Utility Methods
     
     def set_api_key(self, api_key: str) -> None:
         """Update API key."""
         self.config.api_key = api_key
-        self._client.headers["X-API-Key"] = api_key
         self._async_client.headers["X-API-Key"] = api_key
+        self._sync_client.headers["X-API-Key"] = api_key
 
     def close(self) -> None:
-        """Close HTTP clients."""
-        self._client.close()
+        """Close HTTP clients and stop the event loop used by sync methods."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self._sync_client.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+        
+        if not self._async_client.is_closed:
+            try:
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                try:
+                    asyncio.run(self._async_client.aclose())
+                except RuntimeError:
+                    # Its connections belong to an event loop that has already closed
+                    pass
+            else:
+                # Called from async code: close on that loop instead of blocking it
+                self._closing = running_loop.create_task(self._async_client.aclose())
 
     async def aclose(self) -> None:
         """Close async HTTP client."""
@@ -386,24 +431,13 @@ class RateLimiter:
     def __init__(self, requests: int, window: int):
         self.requests = requests
         self.window = window
-        self.calls = []
-        
-    def wait_if_needed(self) -> None:
-        """Wait if rate limit would be exceeded."""
-        now = time.time()
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.window]
-        
-        if len(self.calls) >= self.requests:
-            sleep_time = self.window - (now - self.calls[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-                
-        self.calls.append(now)
+        self.calls = deque()
         
     async def async_wait_if_needed(self) -> None:
         """Wait if rate limit would be exceeded (async)."""
-        now = time.time()
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.window]
+        now = time.monotonic()
+        while self.calls and now - self.calls[0] >= self.window:
+            self.calls.popleft()
         
         if len(self.calls) >= self.requests:
             sleep_time = self.window - (now - self.calls[0])